@@ -2,36 +2,54 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import re
 from pathlib import Path
-from typing import Iterable, Optional, Tuple
+from typing import AsyncIterator, Iterable, Optional, Tuple
 
+import ijson
+import orjson
 from dotenv import load_dotenv
-from fastapi import APIRouter, FastAPI, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, FastAPI, File, HTTPException, Response, UploadFile, status
 from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from .metadata import MetadataProvider
+from .metadata import get_metadata_provider
 from .models import Game, GameCollection
 
 load_dotenv()
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 STATIC_DIR = BASE_DIR / "static"
-STORE_KEYWORDS = {
-    "steam",
-    "epic",
-    "epic games",
-    "epic games store",
-    "gog",
-    "gog galaxy",
-    "amazon",
-    "prime gaming",
-}
+INDEX_FILE = STATIC_DIR / "index.html"
+# Frozen so the per-line membership check works against an immutable,
+# already-lowercase constant.
+STORE_KEYWORDS = frozenset(
+    {
+        "steam",
+        "epic",
+        "epic games",
+        "epic games store",
+        "gog",
+        "gog galaxy",
+        "amazon",
+        "prime gaming",
+    }
+)
+
+# One case-insensitive prefix match per line replaces the partition +
+# strip + lower + set lookup chain. Longer keywords come first so the
+# longest store name wins.
+_SRC_RE = re.compile(
+    r"^(?P<src>"
+    + "|".join(re.escape(k) for k in sorted(STORE_KEYWORDS, key=len, reverse=True))
+    + r")\s*:\s*(?P<rest>\S.*)$",
+    re.IGNORECASE,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +57,7 @@ app = FastAPI(
     title="Game Library Manager",
     description="Upload a text file and surface quick metadata for each game.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -50,8 +69,10 @@ app.add_middleware(
 )
 
 api_router = APIRouter(prefix="/api")
-metadata_provider = MetadataProvider()
+metadata_provider = get_metadata_provider()
 PROFILE_FILENAME = "profile.json"
+# Below this size the whole-file orjson parse is faster than streaming.
+STREAMING_PROFILE_BYTES = 1024 * 1024
 
 
 class ProfileDirectory(BaseModel):
@@ -59,6 +80,10 @@ class ProfileDirectory(BaseModel):
 
 
 class ProfileEntry(BaseModel):
+    # Instantiated once per saved game and never mutated; frozen keeps
+    # the instances immutable and forbid rejects payload typos early.
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     title: str
     platform: Optional[str] = None
     source: Optional[str] = None
@@ -78,15 +103,22 @@ class ProfileSaveRequest(ProfileDirectory):
 
 
 class ManualGameRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     title: str
     platform: Optional[str] = None
     source: Optional[str] = None
     record_id: Optional[int] = None
 
 
+# Load balancers poll this constantly; serve constant bytes with no
+# per-request dict allocation or JSON serialization.
+_HEALTH_RESPONSE_BYTES = b'{"status":"ok"}'
+
+
 @api_router.get("/health")
-async def healthcheck() -> JSONResponse:
-    return JSONResponse({"status": "ok"})
+async def healthcheck() -> Response:
+    return Response(content=_HEALTH_RESPONSE_BYTES, media_type="application/json")
 
 
 def _parse_line(line: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]:
@@ -95,15 +127,14 @@ def _parse_line(line: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]
         return None
 
     source = None
-    if ":" in raw:
-        maybe_source, remainder = raw.split(":", 1)
-        if maybe_source.strip().lower() in STORE_KEYWORDS and remainder.strip():
-            source = maybe_source.strip().title()
-            raw = remainder.strip()
+    match = _SRC_RE.match(raw)
+    if match:
+        source = match.group("src").title()
+        raw = match.group("rest")
 
     platform = None
-    if "|" in raw:
-        title_part, platform_part = raw.split("|", 1)
+    title_part, sep, platform_part = raw.partition("|")
+    if sep:
         raw = title_part.strip()
         platform = platform_part.strip() or None
 
@@ -117,42 +148,98 @@ def _parse_line(line: str) -> Optional[Tuple[str, Optional[str], Optional[str]]]
     return title, platform, source
 
 
-def _parse_file_payload(text: str) -> list[Game]:
-    parsed_games: list[Game] = []
-    for idx, line in enumerate(text.splitlines(), start=1):
-        parsed = _parse_line(line)
-        if not parsed:
-            continue
-        title, platform, source = parsed
-        try:
-            parsed_games.append(metadata_provider.build_game(title, platform, source))
-        except Exception as exc:  # pragma: no cover - just logging for now
-            logger.exception("Failed to build metadata for line %s", idx)
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Unable to process '{title}': {exc}",
-            ) from exc
-    return parsed_games
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 64 * 1024
+
 
+async def _iter_raw_lines(file: UploadFile) -> AsyncIterator[bytes]:
+    """Yield raw lines from an upload without buffering the whole file.
 
-@api_router.post("/games/upload", response_model=GameCollection)
-async def upload_games(file: UploadFile = File(...)) -> GameCollection:
-    contents = await file.read()
-    if not contents:
+    Splitting on ``b"\\n"`` before decoding is safe for UTF-8: a multi-byte
+    character never spans a newline, so each yielded line is decodable on
+    its own.
+    """
+    carry = b""
+    received = 0
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        if not received:
+            # Strip a UTF-8 BOM so it cannot leak into the first title.
+            chunk = chunk.removeprefix(b"\xef\xbb\xbf")
+        received += len(chunk)
+        if received > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Uploaded file is too large.",
+            )
+        carry += chunk
+        if b"\n" in carry:
+            *lines, carry = carry.split(b"\n")
+            for line in lines:
+                yield line
+    if not received:
         raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+    if carry:
+        yield carry
+
+
+async def _parse_upload_rows(
+    file: UploadFile,
+) -> list[Tuple[str, Optional[str], Optional[str]]]:
+    rows: list[Tuple[str, Optional[str], Optional[str]]] = []
+    async for raw in _iter_raw_lines(file):
+        stripped = raw.strip()
+        # Skip blank and comment lines at the bytes level so they never
+        # pay for a UTF-8 decode.
+        if not stripped or stripped.startswith(b"#"):
+            continue
+        parsed = _parse_line(stripped.decode("utf-8"))
+        if parsed:
+            rows.append(parsed)
+    return rows
+
+
+async def _build_games(
+    rows: Iterable[Tuple[str, Optional[str], Optional[str]]]
+) -> list[Game]:
+    rows = list(rows)
+    if not rows:
+        return []
+    # One batched call: cached rows come from memory and the rest share a
+    # single IGDB multiquery instead of one search per title.
+    try:
+        return await run_in_threadpool(metadata_provider.build_many, rows)
+    except Exception as exc:  # pragma: no cover - just logging for now
+        logger.exception("Failed to build metadata for upload")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Unable to process upload: {exc}",
+        ) from exc
+
+
+# The large collection endpoints return pre-serialized ORJSONResponses:
+# the Game instances are already validated at construction, so running
+# them through response_model validation again would just burn CPU. The
+# `responses` entry keeps the OpenAPI schema intact.
+@api_router.post("/games/upload", responses={200: {"model": GameCollection}})
+async def upload_games(file: UploadFile = File(...)) -> ORJSONResponse:
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Uploaded file is too large.",
+        )
     try:
-        text = contents.decode("utf-8")
+        rows = await _parse_upload_rows(file)
     except UnicodeDecodeError as exc:
         raise HTTPException(
             status_code=400, detail="File must be UTF-8 encoded text."
         ) from exc
 
-    games = await run_in_threadpool(_parse_file_payload, text)
+    games = await _build_games(rows)
     if not games:
         raise HTTPException(
             status_code=400, detail="No games were detected. Check the file format."
         )
-    return GameCollection(games=games)
+    return ORJSONResponse(GameCollection(games=games).model_dump(mode="json"))
 
 
 @api_router.post("/games/create", response_model=Game)
@@ -251,43 +338,42 @@ async def lookup_rating(payload: RatingLookupRequest) -> RatingLookupResponse:
 
 
 def _profile_file(path: str) -> Path:
+    # mkdir on every save: it is one cheap syscall with exist_ok, and it
+    # recreates the directory if the user removed it mid-session.
     directory = Path(path).expanduser()
     directory.mkdir(parents=True, exist_ok=True)
     return directory / PROFILE_FILENAME
 
 
 @api_router.post("/profile/save")
-async def save_profile(payload: ProfileSaveRequest) -> JSONResponse:
+async def save_profile(payload: ProfileSaveRequest) -> dict:
     file_path = _profile_file(payload.directory)
-    entries = [
-        {
-            "title": entry.title,
-            "platform": entry.platform,
-            "source": entry.source,
-            "record_id": entry.record_id,
-            "status": entry.status,
-            "finish_count": entry.finish_count,
-            "genres": entry.genres,
-            "rating": entry.rating,
-            "rating_match_title": entry.rating_match_title,
-            "rating_verified": entry.rating_verified,
-            "rating_manual": entry.rating_manual,
-            "rating_source_csv": entry.rating_source_csv,
-        }
-        for entry in payload.games
-    ]
-    file_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
-    return JSONResponse({"path": str(file_path)})
-
-
-@api_router.post("/profile/load", response_model=GameCollection)
-async def load_profile(payload: ProfileDirectory) -> GameCollection:
+    # One C-level traversal of the whole payload beats dumping each entry
+    # from Python when profiles carry thousands of rows.
+    entries = payload.model_dump(mode="json")["games"]
+    await asyncio.to_thread(
+        file_path.write_bytes, orjson.dumps(entries, option=orjson.OPT_INDENT_2)
+    )
+    return {"path": str(file_path)}
+
+
+def _read_profile_entries(file_path: Path) -> list:
+    if file_path.stat().st_size > STREAMING_PROFILE_BYTES:
+        # Large profiles stream entry by entry so peak memory stays at
+        # one entry instead of the whole file plus its parse tree.
+        with file_path.open("rb") as handle:
+            return list(ijson.items(handle, "item", use_float=True))
+    return orjson.loads(file_path.read_bytes())
+
+
+@api_router.post("/profile/load", responses={200: {"model": GameCollection}})
+async def load_profile(payload: ProfileDirectory) -> ORJSONResponse:
     file_path = _profile_file(payload.directory)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Profile not found.")
     try:
-        entries = json.loads(file_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        entries = await asyncio.to_thread(_read_profile_entries, file_path)
+    except (orjson.JSONDecodeError, ijson.JSONError) as exc:
         raise HTTPException(
             status_code=400, detail="Profile file is invalid JSON."
         ) from exc
@@ -323,7 +409,7 @@ async def load_profile(payload: ProfileDirectory) -> GameCollection:
             rating_value, rating_source_csv = (
                 metadata_provider.rating_entry_for_title(rating_match_title)
             )
-        game = game.copy(
+        game = game.model_copy(
             update={
                 "status": status,
                 "finish_count": finish_count,
@@ -344,16 +430,16 @@ async def load_profile(payload: ProfileDirectory) -> GameCollection:
         games.append(game)
     if not games:
         raise HTTPException(status_code=400, detail="Profile contains no games.")
-    return GameCollection(games=games)
+    return ORJSONResponse(GameCollection(games=games).model_dump(mode="json"))
 
 
 @api_router.post("/profile/delete")
-async def delete_profile(payload: ProfileDirectory) -> JSONResponse:
+async def delete_profile(payload: ProfileDirectory) -> dict:
     file_path = _profile_file(payload.directory)
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Profile not found.")
-    file_path.unlink()
-    return JSONResponse({"deleted": True})
+    await asyncio.to_thread(file_path.unlink)
+    return {"deleted": True}
 
 
 SAMPLE_ENTRIES: Iterable[Tuple[str, Optional[str], Optional[str]]] = [
@@ -365,16 +451,40 @@ SAMPLE_ENTRIES: Iterable[Tuple[str, Optional[str], Optional[str]]] = [
 ]
 
 
+def _build_sample_collection() -> Optional[GameCollection]:
+    try:
+        return GameCollection(
+            games=[
+                metadata_provider.build_game(title, platform, source)
+                for title, platform, source in SAMPLE_ENTRIES
+            ]
+        )
+    except Exception:  # pragma: no cover - provider may be offline at import
+        logger.exception("Failed to precompute the sample collection")
+        return None
+
+
+# The sample entries are static, so build the collection once at import
+# instead of re-running metadata lookups on every request.
+_SAMPLE_COLLECTION = _build_sample_collection()
+
+
 @api_router.get("/games/sample", response_model=GameCollection)
 async def sample_games() -> GameCollection:
-    games: list[Game] = []
-    for title, platform, source in SAMPLE_ENTRIES:
-        games.append(
-            await run_in_threadpool(
-                metadata_provider.build_game, title, platform, source
+    global _SAMPLE_COLLECTION
+    if _SAMPLE_COLLECTION is None:
+        _SAMPLE_COLLECTION = await run_in_threadpool(_build_sample_collection)
+        if _SAMPLE_COLLECTION is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Sample games are unavailable right now.",
             )
-        )
-    return GameCollection(games=games)
+    return _SAMPLE_COLLECTION
+
+
+@app.on_event("shutdown")
+async def close_metadata_provider() -> None:
+    metadata_provider.close()
 
 
 app.include_router(api_router)
@@ -384,12 +494,21 @@ if STATIC_DIR.exists():
     app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
+# The index file is static: build one FileResponse at import (it re-opens
+# the file per send, so reuse is safe) and let warm clients revalidate via
+# Cache-Control instead of refetching.
+_INDEX_RESPONSE: Optional[FileResponse] = (
+    FileResponse(INDEX_FILE, headers={"Cache-Control": "public, max-age=300"})
+    if INDEX_FILE.exists()
+    else None
+)
+
+
 @app.get("/", include_in_schema=False)
 async def serve_index() -> FileResponse:
-    index_file = STATIC_DIR / "index.html"
-    if not index_file.exists():
+    if _INDEX_RESPONSE is None:
         raise HTTPException(
             status_code=404,
             detail="Frontend assets are missing. Did you delete the static directory?",
         )
-    return FileResponse(index_file)
+    return _INDEX_RESPONSE
@@ -2,22 +2,38 @@
 
 from __future__ import annotations
 
+import array
+import atexit
 import csv
-import hashlib
+import functools
+import json
 import logging
 import os
 import re
+import sqlite3
+import threading
 import time
-from difflib import SequenceMatcher
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple
 
 import httpx
+import orjson
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - exercised only without rapidfuzz
+    fuzz = process = None
+    from difflib import SequenceMatcher
 
 from .models import Game
 
 logger = logging.getLogger(__name__)
 BASE_DIR = Path(__file__).resolve().parent.parent
+IGDB_CACHE_PATH = BASE_DIR / "database" / "igdb_cache.sqlite"
+IGDB_CACHE_TTL_SECONDS = 30 * 24 * 3600
 RATINGS_FILES = {
     "critic_ratings.csv": BASE_DIR / "database" / "critic_ratings.csv",
     "ps5.csv": BASE_DIR / "database" / "ps5.csv",
@@ -76,10 +92,32 @@ class MetadataLookupError(RuntimeError):
     """Raised when a provider fails to resolve metadata for a title."""
 
 
+# Compiled once: normalize_key sits under every cache key, rating lookup,
+# and slug computation, so skip re's per-call cache lookup.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_WS_RE = re.compile(r"\s+")
+
+# Lowercases ASCII alphanumerics and maps every other ASCII character to a
+# space, so the common all-ASCII title normalizes in one translate pass.
+_NORM_TABLE = {
+    code: ord(chr(code).lower()) if chr(code).isalnum() else 0x20
+    for code in range(128)
+}
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_key(value: str) -> str:
     """Return a normalized key for easy dictionary lookups."""
-    cleaned = re.sub(r"[^a-z0-9]+", " ", value.lower())
-    return re.sub(r"\s+", " ", cleaned).strip()
+    if value.isascii():
+        # join/split collapses whitespace runs and strips the ends without
+        # another regex scan.
+        return " ".join(value.translate(_NORM_TABLE).split())
+    cleaned = _NON_ALNUM_RE.sub(" ", value.lower())
+    return _WS_RE.sub(" ", cleaned).strip()
+
+
+# Exposed so callers (and tests) can reset the memoized keys.
+_normalize_cache_clear = normalize_key.cache_clear
 
 
 def normalize_optional(value: Optional[str]) -> str:
@@ -89,14 +127,23 @@ def normalize_optional(value: Optional[str]) -> str:
 
 
 def slugify(value: str) -> str:
-    return normalize_key(value).replace(" ", "-") or "game"
+    # Thin wrapper for external callers; the slug itself is derived in
+    # _slug_and_seed from an already-normalized title.
+    return _slug_and_seed(value)[0]
+
+
+# Single alternation (longest keywords first) so edition noise is removed
+# in one scan instead of one str.replace per keyword.
+_STRIP_RE = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(k) for k in sorted(STRIP_KEYWORDS, key=len, reverse=True))
+    + r")\b"
+)
 
 
 def strip_keywords(value: str) -> str:
-    normalized = normalize_key(value)
-    for keyword in STRIP_KEYWORDS:
-        normalized = normalized.replace(keyword, " ")
-    normalized = re.sub(r"\s+", " ", normalized).strip()
+    normalized = _STRIP_RE.sub(" ", normalize_key(value))
+    normalized = _WS_RE.sub(" ", normalized).strip()
     return normalized if normalized else value
 
 
@@ -104,26 +151,53 @@ def placeholder_art(seed: str, width: int, height: int) -> str:
     return f"https://picsum.photos/seed/{seed}/{width}/{height}"
 
 
+@functools.lru_cache(maxsize=2048)
 def _slug_and_seed(title: str) -> tuple[str, str]:
     normalized = normalize_key(title)
-    slug = slugify(title)
-    hash_seed = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:8]
+    slug = normalized.replace(" ", "-") or "game"
+    # The seed only picks a deterministic picsum image, so a
+    # non-cryptographic CRC32 beats SHA-256 here.
+    hash_seed = f"{zlib.crc32(normalized.encode('utf-8')):08x}"
     return slug, hash_seed
 
 
+@functools.lru_cache(maxsize=2048)
 def placeholder_assets(title: str) -> tuple[str, str]:
     slug, hash_seed = _slug_and_seed(title)
-    thumbnail_url = placeholder_art(f"{slug}-{hash_seed}-thumb", 320, 200)
-    cover_url = placeholder_art(f"{slug}-{hash_seed}-cover", 512, 768)
-    return thumbnail_url, cover_url
+    base = f"https://picsum.photos/seed/{slug}-{hash_seed}"
+    return f"{base}-thumb/320/200", f"{base}-cover/512/768"
 
 
-def placeholder_gallery(title: str, count: int = 4) -> List[str]:
+@functools.lru_cache(maxsize=2048)
+def _placeholder_gallery_cached(title: str, count: int) -> tuple[str, ...]:
     slug, hash_seed = _slug_and_seed(title)
-    return [
-        placeholder_art(f"{slug}-{hash_seed}-gallery-{idx}", 1024, 576)
-        for idx in range(count)
-    ]
+    # Format the shared prefix once; only the index varies per URL.
+    base = f"https://picsum.photos/seed/{slug}-{hash_seed}-gallery-"
+    return tuple(f"{base}{idx}/1024/576" for idx in range(count))
+
+
+def placeholder_gallery(title: str, count: int = 4) -> List[str]:
+    # The cache holds an immutable tuple; hand callers a fresh list so
+    # they can mutate it safely.
+    return list(_placeholder_gallery_cached(title, count))
+
+
+# The handcrafted catalog is tiny, so resolve defaults once at import and
+# key it through normalize_key; build_game then does a single dict fetch
+# instead of an or-chain per field.
+_CATALOG_DEFAULTS: Dict[str, object] = {
+    "description": DEFAULT_DESCRIPTION,
+    "trailer_url": DEFAULT_TRAILER,
+    "thumbnail_url": None,
+    "cover_url": None,
+    "gallery_urls": None,
+    "rating": None,
+    "genres": [],
+}
+_NORMALIZED_CATALOG: Dict[str, Dict[str, object]] = {
+    normalize_key(key): {**_CATALOG_DEFAULTS, **entry}
+    for key, entry in HANDCRAFTED_METADATA.items()
+}
 
 
 class PlaceholderMetadataProvider:
@@ -132,47 +206,103 @@ class PlaceholderMetadataProvider:
     def build_game(
         self, title: str, platform: Optional[str] = None, source: Optional[str] = None
     ) -> Game:
-        normalized = normalize_key(title)
-        catalog = HANDCRAFTED_METADATA.get(normalized, {})
-        thumbnail_url, cover_url = placeholder_assets(title)
-        trailer_url = catalog.get("trailer_url") or DEFAULT_TRAILER
-        description = catalog.get("description") or DEFAULT_DESCRIPTION
-        gallery_urls = catalog.get("gallery_urls") or placeholder_gallery(title)
-        rating = catalog.get("rating")
+        catalog = _NORMALIZED_CATALOG.get(normalize_key(title), _CATALOG_DEFAULTS)
+        thumbnail_url = catalog["thumbnail_url"]
+        cover_url = catalog["cover_url"]
+        if thumbnail_url is None:
+            thumbnail_url, cover_url = placeholder_assets(title)
 
         return Game(
             title=title,
             platform=platform,
             source=source or platform,
             record_id=None,
-            description=description,
-            thumbnail_url=catalog.get("thumbnail_url") or thumbnail_url,
-            cover_url=catalog.get("cover_url") or cover_url,
-            trailer_url=trailer_url,
-            rating=rating,
-            gallery_urls=gallery_urls,
+            description=catalog["description"],
+            thumbnail_url=thumbnail_url,
+            cover_url=cover_url,
+            trailer_url=catalog["trailer_url"],
+            rating=catalog["rating"],
+            gallery_urls=catalog["gallery_urls"] or placeholder_gallery(title),
             status="not_allocated",
             finish_count=0,
-            genres=catalog.get("genres") or [],
+            genres=catalog["genres"],
         )
 
 
+_GALLERY_PREFIX = "https://images.igdb.com/igdb/image/upload/t_screenshot_huge/"
+_THUMBNAIL_FMT = "https://images.igdb.com/igdb/image/upload/t_cover_big/{}.jpg"
+_COVER_FMT = "https://images.igdb.com/igdb/image/upload/t_1080p/{}.jpg"
+
+# One scan over the record name replaces a containment check per keyword.
+_EXCLUDED_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in EXCLUDED_KEYWORDS) + r")\b"
+)
+
+
 class IgdbClient:
     TOKEN_URL = "https://id.twitch.tv/oauth2/token"
     API_BASE = "https://api.igdb.com/v4"
-
-    def __init__(self, client_id: str, client_secret: str, timeout: float = 10.0) -> None:
+    # Shared field list and prebuilt query template: per-request work is a
+    # single .format instead of re-concatenating the whole body.
+    _FIELDS = (
+        "name,summary,platforms.name,platforms.abbreviation,"
+        "cover.image_id,artworks.image_id,screenshots.image_id,videos.video_id,"
+        "genres.name"
+    )
+    _QUERY_TEMPLATE = 'search "{title}"; fields ' + _FIELDS + "; limit {limit};"
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        timeout: float = 10.0,
+        http_client: Optional[httpx.Client] = None,
+    ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
         self._token: Optional[str] = None
         self._token_expiry: float = 0
-        self._http = httpx.Client(timeout=timeout)
+        self._token_lock = threading.Lock()
+        self._cached_headers: Dict[str, str] = {}
+        # Callers can inject a shared httpx.Client so several IgdbClient
+        # instances reuse one connection pool; we only close pools we own.
+        self._owns_http = http_client is None
+        if http_client is not None:
+            self._http = http_client
+        else:
+            # Keep-alive pooling plus HTTP/2 so bursts of lookups reuse
+            # one TLS session instead of paying a handshake per request.
+            self._http = httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=300.0,
+                ),
+                http2=True,
+            )
+            # Belt and braces: close the pool even if the app shutdown
+            # hook never runs (scripts, crashed reloads).
+            atexit.register(self._http.close)
+        # Session-local search results keyed by normalized title, so UI
+        # refreshes and rescans skip the network for titles already seen.
+        self._search_cache = _LruCache(maxsize=1024)
+
+    def close(self) -> None:
+        if self._owns_http:
+            self._http.close()
 
     def _auth_headers(self) -> Dict[str, str]:
+        # The header dict only changes when the token does, so reuse the
+        # one built during refresh instead of formatting it per request.
+        # The fast path stays lock-free; the lock only serializes the rare
+        # (hourly) refresh so concurrent callers don't stampede the token
+        # endpoint.
         if not self._token or time.time() >= self._token_expiry:
-            self._refresh_token()
-        assert self._token  # for type checkers
-        return {"Client-ID": self.client_id, "Authorization": f"Bearer {self._token}"}
+            with self._token_lock:
+                if not self._token or time.time() >= self._token_expiry:
+                    self._refresh_token()
+        return self._cached_headers
 
     def _refresh_token(self) -> None:
         response = self._http.post(
@@ -184,56 +314,116 @@ class IgdbClient:
             },
         )
         response.raise_for_status()
-        payload = response.json()
-        self._token = payload["access_token"]
+        payload = orjson.loads(response.content)
+        token = payload["access_token"]
+        # Publish the headers before the expiry: lock-free readers in
+        # _auth_headers gate on the expiry check, so it must be the last
+        # field they can observe changing or they could return stale (or
+        # initial empty) headers against a fresh expiry.
+        self._token = token
+        self._cached_headers = {
+            "Client-ID": self.client_id,
+            "Authorization": f"Bearer {token}",
+        }
         self._token_expiry = time.time() + int(payload.get("expires_in", 3600)) - 60
 
+    @staticmethod
+    def _search_query(title: str, limit: int, strip_input: bool) -> str:
+        query_value = strip_keywords(title) if strip_input else title
+        query_title = query_value.replace('"', " ")
+        return IgdbClient._QUERY_TEMPLATE.format(title=query_title, limit=limit)
+
+    def _search_cache_key(
+        self, title: str, limit: int, strip_input: bool
+    ) -> tuple[str, int, bool]:
+        return (normalize_key(title), limit, strip_input)
+
     def search_games(
         self, title: str, limit: int = 5, strip_input: bool = True
     ) -> list[Dict]:
-        query_value = strip_keywords(title) if strip_input else title
-        query_title = query_value.replace('"', " ")
+        cache_key = self._search_cache_key(title, limit, strip_input)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached
         logger.debug("IGDB request: search_games title='%s' limit=%s", title, limit)
-        query = (
-            f'search "{query_title}";'
-            " fields name,summary,platforms.name,platforms.abbreviation,"
-            "cover.image_id,artworks.image_id,screenshots.image_id,videos.video_id,"
-            "genres.name;"
-            f" limit {limit};"
-        )
-
         response = self._http.post(
             f"{self.API_BASE}/games",
-            data=query,
+            data=self._search_query(title, limit, strip_input),
             headers=self._auth_headers(),
         )
         response.raise_for_status()
-        results = response.json()
+        results = orjson.loads(response.content)
         logger.debug("IGDB search for '%s' returned %s results", title, len(results))
+        self._search_cache[cache_key] = results
         return results
 
+    def multi_search(
+        self, titles: Sequence[str], limit: int = 5, strip_input: bool = True
+    ) -> Dict[str, list[Dict]]:
+        """Resolve several title searches in one /multiquery round trip."""
+        if not titles:
+            return {}
+        parts = [
+            f'query games "game_{idx}" {{ {self._search_query(title, limit, strip_input)} }};'
+            for idx, title in enumerate(titles)
+        ]
+        logger.debug("IGDB request: multi_search for %s titles", len(titles))
+        response = self._http.post(
+            f"{self.API_BASE}/multiquery",
+            data="\n".join(parts),
+            headers=self._auth_headers(),
+        )
+        response.raise_for_status()
+        by_name = {
+            item.get("name"): item.get("result") or []
+            for item in orjson.loads(response.content)
+        }
+        return {
+            title: by_name.get(f"game_{idx}", [])
+            for idx, title in enumerate(titles)
+        }
+
     def get_game_by_id(self, record_id: int) -> Optional[Dict]:
         logger.debug("IGDB request: get_game_by_id id=%s", record_id)
-        query = (
-            f"where id = {record_id};"
-            " fields name,summary,platforms.name,platforms.abbreviation,"
-            "cover.image_id,artworks.image_id,screenshots.image_id,videos.video_id,"
-            "genres.name;"
-        )
+        query = f"where id = {record_id}; fields {self._FIELDS};"
         response = self._http.post(
             f"{self.API_BASE}/games",
             data=query,
             headers=self._auth_headers(),
         )
         response.raise_for_status()
-        results = response.json()
+        results = orjson.loads(response.content)
         return results[0] if results else None
 
 
+@dataclass(slots=True)
+class _IgdbParsed:
+    """Fields extracted from an IGDB record in a single traversal."""
+
+    thumbnail_url: str
+    cover_url: str
+    gallery_urls: List[str]
+    trailer_url: Optional[str]
+    platform: Optional[str]
+    description: str
+    genres: List[str]
+
+
 class IgdbMetadataProvider:
     def __init__(self, client_id: str, client_secret: str) -> None:
         self.client = IgdbClient(client_id, client_secret)
 
+    def resolve_record(
+        self, title: str, record_id: Optional[int] = None
+    ) -> Optional[Dict]:
+        """Return the best IGDB record for a title, or None when unmatched."""
+        if record_id is not None:
+            record = self.client.get_game_by_id(record_id)
+            if record:
+                return record
+        records = self.client.search_games(title)
+        return self._select_record(records, title)
+
     def build_game(
         self,
         title: str,
@@ -241,13 +431,7 @@ class IgdbMetadataProvider:
         source: Optional[str] = None,
         record_id: Optional[int] = None,
     ) -> Game:
-        if record_id is not None:
-            record = self.client.get_game_by_id(record_id)
-            if record:
-                return self._build_from_record(record, title, platform, source)
-
-        records = self.client.search_games(title)
-        record = self._select_record(records, title)
+        record = self.resolve_record(title, record_id)
         if not record:
             raise MetadataLookupError(f"No IGDB match for '{title}'")
 
@@ -261,32 +445,28 @@ class IgdbMetadataProvider:
     def _build_from_record(
         self, record: Dict, fallback_title: str, platform: Optional[str], source: Optional[str]
     ) -> Game:
-        thumbnail_url, cover_url = self._image_urls(record, fallback_title)
-        gallery_urls = self._gallery_urls(record, fallback_title)
-        trailer_url = self._trailer_url(record)
-        description = record.get("summary") or DEFAULT_DESCRIPTION
-        resolved_platform = platform or self._platform_name(record)
+        parsed = self._parse_record(record, fallback_title)
+        resolved_platform = platform or parsed.platform
         resolved_source = source or resolved_platform
         user_title = (fallback_title or "").strip()
         resolved_title = (
             user_title or record.get("name") or fallback_title or "Untitled Game"
         )
-        genres = self._genre_names(record)
 
         return Game(
             title=resolved_title,
             platform=resolved_platform,
             source=resolved_source,
             record_id=record.get("id"),
-            description=description,
-            thumbnail_url=thumbnail_url,
-            cover_url=cover_url,
-            trailer_url=trailer_url or DEFAULT_TRAILER,
+            description=parsed.description,
+            thumbnail_url=parsed.thumbnail_url,
+            cover_url=parsed.cover_url,
+            trailer_url=parsed.trailer_url or DEFAULT_TRAILER,
             rating=None,
-            gallery_urls=gallery_urls,
+            gallery_urls=parsed.gallery_urls,
             status="not_allocated",
             finish_count=0,
-            genres=genres,
+            genres=parsed.genres,
         )
 
     @staticmethod
@@ -294,10 +474,9 @@ class IgdbMetadataProvider:
         normalized_input = normalize_key(strip_keywords(original_title))
         for record in records:
             name = record.get("name") or ""
-            lower_name = name.lower()
             excluded = any(
-                keyword in lower_name and keyword not in normalized_input
-                for keyword in EXCLUDED_KEYWORDS
+                keyword not in normalized_input
+                for keyword in _EXCLUDED_RE.findall(name.lower())
             )
             if excluded:
                 continue
@@ -305,68 +484,121 @@ class IgdbMetadataProvider:
         return records[0] if records else None
 
     @staticmethod
-    def _platform_name(record: Dict) -> Optional[str]:
-        platforms: Sequence[Dict] = record.get("platforms") or []
-        if not platforms:
-            return None
-        platform = platforms[0]
-        return platform.get("abbreviation") or platform.get("name")
-
-    @staticmethod
-    def _image_id(record: Dict) -> Optional[str]:
+    def _parse_record(record: Dict, title: str) -> _IgdbParsed:
+        """Extract every field _build_from_record needs in one pass.
+
+        The old helpers each re-walked cover/screenshots/artworks; the
+        shared screenshot scan here feeds both the hero image fallback
+        and the gallery.
+        """
+        shot_ids = [
+            entry["image_id"]
+            for field in ("screenshots", "artworks")
+            for entry in (record.get(field) or [])[:6]
+            if entry.get("image_id")
+        ]
         cover = record.get("cover")
-        if cover and cover.get("image_id"):
-            return cover["image_id"]
-        for field in ("screenshots", "artworks"):
-            entries: Sequence[Dict] = record.get(field) or []
-            if entries:
-                candidate = entries[0].get("image_id")
-                if candidate:
-                    return candidate
-        return None
-
-    def _image_urls(self, record: Dict, title: str) -> tuple[str, str]:
-        image_id = self._image_id(record)
+        image_id = (cover.get("image_id") if cover else None) or (
+            shot_ids[0] if shot_ids else None
+        )
         if image_id:
-            thumbnail = f"https://images.igdb.com/igdb/image/upload/t_cover_big/{image_id}.jpg"
-            cover = f"https://images.igdb.com/igdb/image/upload/t_1080p/{image_id}.jpg"
-            return thumbnail, cover
-
-        return placeholder_assets(title)
-
-    def _gallery_urls(self, record: Dict, title: str) -> List[str]:
-        gallery: List[str] = []
-        for field in ("screenshots", "artworks"):
-            entries: Sequence[Dict] = record.get(field) or []
-            for entry in entries[:6]:
-                image_id = entry.get("image_id")
-                if image_id:
-                    gallery.append(
-                        f"https://images.igdb.com/igdb/image/upload/t_screenshot_huge/{image_id}.jpg"
-                    )
-        if not gallery:
-            return placeholder_gallery(title)
-        return gallery
+            thumbnail_url = _THUMBNAIL_FMT.format(image_id)
+            cover_url = _COVER_FMT.format(image_id)
+        else:
+            thumbnail_url, cover_url = placeholder_assets(title)
+
+        if shot_ids:
+            gallery_urls = [f"{_GALLERY_PREFIX}{img}.jpg" for img in shot_ids]
+        else:
+            gallery_urls = placeholder_gallery(title)
 
-    @staticmethod
-    def _trailer_url(record: Dict) -> Optional[str]:
         videos: Sequence[Dict] = record.get("videos") or []
-        if not videos:
-            return None
-        video_id = videos[0].get("video_id")
-        if not video_id:
-            return None
-        return f"https://www.youtube.com/embed/{video_id}?rel=0"
+        video_id = videos[0].get("video_id") if videos else None
+        trailer_url = (
+            f"https://www.youtube.com/embed/{video_id}?rel=0" if video_id else None
+        )
 
-    @staticmethod
-    def _genre_names(record: Dict) -> list[str]:
-        genres: Sequence[Dict] = record.get("genres") or []
-        names: list[str] = []
-        for entry in genres:
-            name = entry.get("name")
-            if name:
-                names.append(name)
-        return names
+        platforms: Sequence[Dict] = record.get("platforms") or []
+        platform = (
+            platforms[0].get("abbreviation") or platforms[0].get("name")
+            if platforms
+            else None
+        )
+
+        return _IgdbParsed(
+            thumbnail_url=thumbnail_url,
+            cover_url=cover_url,
+            gallery_urls=gallery_urls,
+            trailer_url=trailer_url,
+            platform=platform,
+            description=record.get("summary") or DEFAULT_DESCRIPTION,
+            genres=[
+                entry["name"]
+                for entry in (record.get("genres") or [])
+                if entry.get("name")
+            ],
+        )
+
+
+class _LruCache:
+    """Minimal LRU mapping so the Game cache stays bounded.
+
+    Long-running servers see an unbounded stream of distinct lookups;
+    evicting the least recently used entry caps memory without a new
+    dependency.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        # Uploads hit the cache from a threadpool; get/move_to_end and
+        # set/evict are compound operations, so serialize them.
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+@dataclass(slots=True)
+class _RatingsTable:
+    """Struct-of-arrays view of the critic-ratings entries.
+
+    The fuzzy scans only touch ``keys``; keeping it a contiguous list of
+    strings (with titles, scores, and source files in parallel arrays)
+    lets RapidFuzz walk it directly and hand back an index.
+    """
+
+    keys: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    scores: array.array = field(default_factory=lambda: array.array("d"))
+    sources: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def append(self, key: str, title: str, score: float, source: str) -> None:
+        self.keys.append(key)
+        self.titles.append(title)
+        self.scores.append(score)
+        self.sources.append(source)
 
 
 class MetadataProvider:
@@ -377,12 +609,18 @@ class MetadataProvider:
         client_secret = os.getenv("IGDB_CLIENT_SECRET")
         self.offline_provider = PlaceholderMetadataProvider()
         self.primary_provider: Optional[IgdbMetadataProvider] = None
-        self._cache: Dict[Tuple[str, str, str, Optional[int]], Game] = {}
+        self._cache: _LruCache = _LruCache(maxsize=4096)
         (
             self._critic_ratings_map,
-            self._ratings_entries,
+            self._ratings,
             self._ratings_map,
         ) = self._load_critic_ratings()
+        # Character-trigram inverted index so suggestion searches score a
+        # handful of candidates instead of the whole table.
+        self._trigram_index: Dict[str, set[int]] = {}
+        for index, key in enumerate(self._ratings.keys):
+            for trigram in self._trigrams(key):
+                self._trigram_index.setdefault(trigram, set()).add(index)
 
         if client_id and client_secret:
             self.primary_provider = IgdbMetadataProvider(client_id, client_secret)
@@ -392,14 +630,97 @@ class MetadataProvider:
                 "IGDB_CLIENT_ID/IGDB_CLIENT_SECRET not set. Using placeholder metadata."
             )
 
+        # Second-level record cache that survives restarts, so a warm
+        # library rebuild costs zero IGDB calls.
+        self._disk_cache: Optional[sqlite3.Connection] = None
+        self._disk_cache_lock = threading.Lock()
+        if self.primary_provider:
+            self._disk_cache = self._open_disk_cache()
+
+    # Sentinel distinguishing "not in the disk cache" from a cached
+    # no-match (stored as a NULL record).
+    _DISK_MISS = object()
+
+    @staticmethod
+    def _open_disk_cache() -> Optional[sqlite3.Connection]:
+        try:
+            IGDB_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(IGDB_CACHE_PATH, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "key TEXT PRIMARY KEY, fetched_at INTEGER, "
+                "record TEXT, igdb_match INTEGER)"
+            )
+            conn.execute(
+                "DELETE FROM records WHERE fetched_at < ?",
+                (int(time.time()) - IGDB_CACHE_TTL_SECONDS,),
+            )
+            conn.commit()
+            return conn
+        except sqlite3.Error as exc:
+            logger.warning("Disabling IGDB disk cache: %s", exc)
+            return None
+
+    @staticmethod
+    def _disk_key(cache_key: Tuple[str, str, str, Optional[int]]) -> str:
+        return json.dumps(cache_key)
+
+    def _disk_cache_get(self, cache_key: Tuple[str, str, str, Optional[int]]):
+        if self._disk_cache is None:
+            return self._DISK_MISS
+        try:
+            with self._disk_cache_lock:
+                row = self._disk_cache.execute(
+                    "SELECT record, igdb_match, fetched_at FROM records WHERE key = ?",
+                    (self._disk_key(cache_key),),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            logger.warning("IGDB disk cache read failed: %s", exc)
+            return self._DISK_MISS
+        if not row or row[2] < time.time() - IGDB_CACHE_TTL_SECONDS:
+            return self._DISK_MISS
+        if not row[1]:
+            return None
+        return json.loads(row[0])
+
+    def _disk_cache_put(
+        self,
+        cache_key: Tuple[str, str, str, Optional[int]],
+        record: Optional[Dict],
+    ) -> None:
+        if self._disk_cache is None:
+            return
+        try:
+            with self._disk_cache_lock:
+                self._disk_cache.execute(
+                    "INSERT OR REPLACE INTO records (key, fetched_at, record, igdb_match)"
+                    " VALUES (?, ?, ?, ?)",
+                    (
+                        self._disk_key(cache_key),
+                        int(time.time()),
+                        json.dumps(record) if record is not None else None,
+                        1 if record is not None else 0,
+                    ),
+                )
+                self._disk_cache.commit()
+        except sqlite3.Error as exc:
+            logger.warning("IGDB disk cache write failed: %s", exc)
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by the IGDB client."""
+        if self.primary_provider:
+            self.primary_provider.client.close()
+
     @staticmethod
     def _load_critic_ratings() -> tuple[
         Dict[str, tuple[str, float, str]],
-        list[tuple[str, str, float, str]],
+        _RatingsTable,
         Dict[str, tuple[str, float, str]],
     ]:
         critic_map: Dict[str, tuple[str, float, str]] = {}
-        entries: list[tuple[str, str, float, str]] = []
+        entries = _RatingsTable()
         combined_map: Dict[str, tuple[str, float, str]] = {}
 
         for source_name, path in RATINGS_FILES.items():
@@ -408,10 +729,25 @@ class MetadataProvider:
                 continue
             try:
                 with path.open(newline="", encoding="utf-8") as handle:
-                    reader = csv.DictReader(handle)
+                    # Plain reader with header-resolved indices: no dict
+                    # construction per row when only two columns matter.
+                    reader = csv.reader(handle)
+                    try:
+                        header = next(reader)
+                        title_idx = header.index("title")
+                        score_idx = header.index("score")
+                    except (StopIteration, ValueError):
+                        logger.warning(
+                            "Critic ratings file %s is missing title/score columns",
+                            path,
+                        )
+                        continue
+                    max_idx = max(title_idx, score_idx)
                     for row in reader:
-                        title = (row.get("title") or "").strip()
-                        score_value = (row.get("score") or "").strip()
+                        if len(row) <= max_idx:
+                            continue
+                        title = row[title_idx].strip()
+                        score_value = row[score_idx].strip()
                         if not title or not score_value:
                             continue
                         try:
@@ -420,7 +756,7 @@ class MetadataProvider:
                             continue
                         normalized = normalize_key(title)
                         entry = (title, score, source_name)
-                        entries.append((normalized, title, score, source_name))
+                        entries.append(normalized, title, score, source_name)
                         combined_map.setdefault(normalized, entry)
                         if source_name == "critic_ratings.csv":
                             critic_map[normalized] = entry
@@ -431,12 +767,11 @@ class MetadataProvider:
 
     @staticmethod
     def _cache_key(
-        title: str,
+        normalized_title: str,
         platform: Optional[str],
         source: Optional[str],
         record_id: Optional[int],
     ) -> Tuple[str, str, str, Optional[int]]:
-        normalized_title = normalize_key(title)
         platform_key = normalize_optional(platform)
         source_key = normalize_optional(source)
         return (normalized_title, platform_key, source_key, record_id)
@@ -448,7 +783,10 @@ class MetadataProvider:
         source: Optional[str] = None,
         record_id: Optional[int] = None,
     ) -> Game:
-        cache_key = self._cache_key(title, platform, source, record_id)
+        # Normalize once and reuse for both the cache key and the rating
+        # lookup below.
+        normalized_title = normalize_key(title)
+        cache_key = self._cache_key(normalized_title, platform, source, record_id)
         cached = self._cache.get(cache_key)
         if cached:
             logger.debug(
@@ -469,20 +807,28 @@ class MetadataProvider:
                 record_id,
             )
             try:
-                game = self.primary_provider.build_game(
-                    title, platform, source, record_id=record_id
-                )
-                self._cache[cache_key] = game
-                logger.debug(
-                    "Metadata cache store (IGDB) for title='%s' platform='%s' source='%s' record_id=%s",
-                    title,
-                    platform,
-                    source,
-                    record_id,
-                )
-                game = game.copy(update={"igdb_match": True})
-                return self._apply_critic_rating(game)
-            except MetadataLookupError:
+                record = self._disk_cache_get(cache_key)
+                if record is self._DISK_MISS:
+                    record = self.primary_provider.resolve_record(title, record_id)
+                    self._disk_cache_put(cache_key, record)
+                if record:
+                    game = self.primary_provider.build_game_from_record(
+                        record, title, platform, source
+                    )
+                    self._cache[cache_key] = game
+                    logger.debug(
+                        "Metadata cache store (IGDB) for title='%s' platform='%s' source='%s' record_id=%s",
+                        title,
+                        platform,
+                        source,
+                        record_id,
+                    )
+                    return game.model_copy(
+                        update={
+                            **self._critic_rating_update(normalized_title),
+                            "igdb_match": True,
+                        }
+                    )
                 game = self._empty_game(title, platform, source, record_id)
                 self._cache[cache_key] = game
                 logger.info(
@@ -492,13 +838,25 @@ class MetadataProvider:
                     source,
                     record_id,
                 )
-                return self._apply_critic_rating(game)
-            except Exception as exc:  # pragma: no cover - best-effort logging
+                return game.model_copy(
+                    update=self._critic_rating_update(normalized_title)
+                )
+            except (
+                MetadataLookupError,
+                httpx.HTTPError,
+                orjson.JSONDecodeError,
+            ) as exc:
+                # Only lookup/transport failures fall back to placeholders;
+                # programming errors should surface instead of being eaten.
                 logger.warning("Falling back to placeholder metadata: %s", exc)
 
         game = self.offline_provider.build_game(title, platform, source)
-        game = game.copy(update={"igdb_match": False})
-        game = self._apply_critic_rating(game)
+        game = game.model_copy(
+            update={
+                **self._critic_rating_update(normalized_title),
+                "igdb_match": False,
+            }
+        )
         self._cache[cache_key] = game
         logger.debug(
             "Metadata cache store (placeholder) for title='%s' platform='%s' source='%s'",
@@ -508,48 +866,128 @@ class MetadataProvider:
         )
         return game
 
-    def _apply_critic_rating(self, game: Game) -> Game:
-        rating, match_title, source_csv = self._lookup_critic_rating(game.title)
-        return game.copy(
-            update={
-                "rating": rating,
-                "rating_match_title": match_title,
-                "rating_source_csv": source_csv,
-                "rating_verified": False,
-                "rating_manual": False,
-            }
-        )
+    def _critic_rating_update(self, normalized_title: str) -> Dict[str, object]:
+        """Return the rating fields for an already-normalized title.
+
+        Callers merge it into a single model_copy so each build pays for
+        one pydantic copy instead of two.
+        """
+        rating, match_title, source_csv = self._lookup_normalized(normalized_title)
+        return {
+            "rating": rating,
+            "rating_match_title": match_title,
+            "rating_source_csv": source_csv,
+            "rating_verified": False,
+            "rating_manual": False,
+        }
 
     def _lookup_critic_rating(
         self, title: str
     ) -> tuple[Optional[float], Optional[str], Optional[str]]:
-        normalized = normalize_key(title)
+        return self._lookup_normalized(normalize_key(title))
+
+    def _lookup_normalized(
+        self, normalized: str
+    ) -> tuple[Optional[float], Optional[str], Optional[str]]:
         if not normalized:
             return None, None, None
 
         exact = self._critic_ratings_map.get(normalized)
         if exact:
-            matched_title, score, source_csv = exact
-            match_title = None if normalize_key(matched_title) == normalized else matched_title
-            return score, match_title, source_csv
+            # The map key is the normalized title, so an exact hit never
+            # needs a corrective match title.
+            _, score, source_csv = exact
+            return score, None, source_csv
 
-        if not self._ratings_entries:
+        if not self._ratings:
+            return None, None, None
+
+        if process is not None:
+            # fuzz.ratio mirrors SequenceMatcher.ratio(); WRatio would
+            # inflate substring matches (e.g. "ring" vs "elden ring") past
+            # the cutoff and attach the wrong rating to short titles.
+            best = process.extractOne(
+                normalized, self._ratings.keys, scorer=fuzz.ratio, score_cutoff=60
+            )
+            index = best[2] if best else None
+        else:
+            index = self._fallback_best_index(normalized)
+        if index is None:
             return None, None, None
+        matched_title = self._ratings.titles[index]
+        score = self._ratings.scores[index]
+        source_csv = self._ratings.sources[index]
+        # keys[index] is the normalized matched title computed at load
+        # time, so no per-query renormalization is needed here.
+        match_title = None if self._ratings.keys[index] == normalized else matched_title
+        return score, match_title, source_csv
 
+    def _fallback_best_index(self, normalized: str) -> Optional[int]:
+        """Pure-Python best match used when rapidfuzz is unavailable.
+
+        One SequenceMatcher is reused across the scan and the cheap
+        real_quick_ratio/quick_ratio upper bounds skip entries that
+        cannot reach the 0.6 cutoff (or beat the current best) before
+        the expensive ratio() runs.
+        """
+        matcher = SequenceMatcher()
+        matcher.set_seq2(normalized)
         best_ratio = 0.0
-        best_entry: Optional[tuple[str, str, float, str]] = None
-        for key, matched_title, score, source_csv in self._ratings_entries:
-            ratio = SequenceMatcher(None, normalized, key).ratio()
+        best_index: Optional[int] = None
+        for index, key in enumerate(self._ratings.keys):
+            matcher.set_seq1(key)
+            bar = max(0.6, best_ratio)
+            if matcher.real_quick_ratio() < bar or matcher.quick_ratio() < bar:
+                continue
+            ratio = matcher.ratio()
             if ratio > best_ratio:
                 best_ratio = ratio
-                best_entry = (key, matched_title, score, source_csv)
-
-        if not best_entry or best_ratio < 0.6:
-            return None, None, None
+                best_index = index
+        if best_index is None or best_ratio < 0.6:
+            return None
+        return best_index
 
-        key, matched_title, score, source_csv = best_entry
-        match_title = None if normalize_key(matched_title) == normalized else matched_title
-        return score, match_title, source_csv
+    @staticmethod
+    def _trigrams(key: str) -> set[str]:
+        return {key[i : i + 3] for i in range(len(key) - 2)}
+
+    def _candidate_indexes(self, normalized: str) -> list[int]:
+        """Return entry indexes worth fuzzy-scoring for a query.
+
+        Queries shorter than a trigram fall back to the full table; so do
+        queries whose trigrams match nothing, so typos still get the old
+        behavior.
+        """
+        if len(normalized) < 3:
+            return list(range(len(self._ratings)))
+        candidates: set[int] = set()
+        for trigram in self._trigrams(normalized):
+            candidates |= self._trigram_index.get(trigram, set())
+        if not candidates:
+            return list(range(len(self._ratings)))
+        return sorted(candidates)
+
+    def _fallback_ranked_indexes(
+        self, normalized: str, candidates: Sequence[int]
+    ) -> list[int]:
+        matcher = SequenceMatcher()
+        matcher.set_seq2(normalized)
+        scored: list[tuple[float, str, int]] = []
+        for index in candidates:
+            key = self._ratings.keys[index]
+            boost = 0.25 if normalized in key else 0.0
+            matcher.set_seq1(key)
+            if (
+                matcher.real_quick_ratio() + boost < 0.35
+                or matcher.quick_ratio() + boost < 0.35
+            ):
+                continue
+            ratio = matcher.ratio() + boost
+            if ratio < 0.35:
+                continue
+            scored.append((ratio, self._ratings.titles[index], index))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [index for _, _, index in scored]
 
     def lookup_critic_rating(
         self, title: str
@@ -560,22 +998,35 @@ class MetadataProvider:
         self, query: str, limit: int = 8
     ) -> list[Dict[str, object]]:
         normalized = normalize_key(query)
-        if not normalized or not self._ratings_entries:
+        if not normalized or not self._ratings:
             return []
 
-        scored: list[tuple[float, str, float, str]] = []
-        for key, matched_title, score, source_csv in self._ratings_entries:
-            ratio = SequenceMatcher(None, normalized, key).ratio()
-            if normalized in key:
-                ratio += 0.25
-            if ratio < 0.35:
-                continue
-            scored.append((ratio, matched_title, score, source_csv))
-
-        scored.sort(key=lambda item: (-item[0], item[1]))
+        candidates = self._candidate_indexes(normalized)
+        if fuzz is not None:
+            # Same scoring as _fallback_ranked_indexes: plain ratio plus a
+            # substring boost, so short prefixes like "zeld" still surface
+            # their full titles and both paths rank identically.
+            scored: list[tuple[float, str, int]] = []
+            for index in candidates:
+                key = self._ratings.keys[index]
+                boost = 0.25 if normalized in key else 0.0
+                score = fuzz.ratio(
+                    normalized, key, score_cutoff=35.0 - boost * 100.0
+                )
+                total = score / 100.0 + boost
+                if total < 0.35:
+                    continue
+                scored.append((total, self._ratings.titles[index], index))
+            scored.sort(key=lambda item: (-item[0], item[1]))
+            ranked = [index for _, _, index in scored]
+        else:
+            ranked = self._fallback_ranked_indexes(normalized, candidates)
         results: list[Dict[str, object]] = []
         seen = set()
-        for _, title, score, source_csv in scored:
+        for index in ranked:
+            title = self._ratings.titles[index]
+            score = self._ratings.scores[index]
+            source_csv = self._ratings.sources[index]
             key = (title, source_csv, score)
             if key in seen:
                 continue
@@ -664,6 +1115,97 @@ class MetadataProvider:
             logger.warning("Failed to fetch IGDB choices: %s", exc)
             return [self.offline_provider.build_game(title, platform, source)]
 
+    def build_many(
+        self,
+        rows: Sequence[Tuple[str, Optional[str], Optional[str]]],
+    ) -> list[Game]:
+        """Build games for several (title, platform, source) rows at once.
+
+        Cached rows are served from memory; the remaining titles share a
+        single /multiquery request instead of one search each. Falls back
+        to per-row build_game when the batch call fails.
+        """
+        if not self.primary_provider:
+            return [self.build_game(*row) for row in rows]
+
+        built: Dict[
+            Tuple[str, Optional[str], Optional[str]], Game
+        ] = {}
+        pending: list[Tuple[str, Optional[str], Optional[str]]] = []
+        for row in dict.fromkeys(rows):
+            title, platform, source = row
+            normalized_title = normalize_key(title)
+            cache_key = self._cache_key(normalized_title, platform, source, None)
+            cached = self._cache.get(cache_key)
+            if cached:
+                built[row] = cached
+                continue
+            # Warm restarts serve records (and cached no-matches) from the
+            # SQLite cache instead of joining the multiquery.
+            record = self._disk_cache_get(cache_key)
+            if record is not self._DISK_MISS:
+                game = self._batch_game(
+                    record, title, platform, source, normalized_title
+                )
+                self._cache[cache_key] = game
+                built[row] = game
+            else:
+                pending.append(row)
+
+        if pending:
+            pending_titles = list(dict.fromkeys(row[0] for row in pending))
+            try:
+                records_by_title = self.primary_provider.client.multi_search(
+                    pending_titles
+                )
+            except Exception as exc:
+                logger.warning(
+                    "IGDB multiquery failed, falling back per title: %s", exc
+                )
+                records_by_title = None
+            for row in pending:
+                title, platform, source = row
+                if records_by_title is None:
+                    built[row] = self.build_game(title, platform, source)
+                    continue
+                normalized_title = normalize_key(title)
+                cache_key = self._cache_key(
+                    normalized_title, platform, source, None
+                )
+                record = IgdbMetadataProvider._select_record(
+                    records_by_title.get(title) or [], title
+                )
+                self._disk_cache_put(cache_key, record)
+                game = self._batch_game(
+                    record, title, platform, source, normalized_title
+                )
+                self._cache[cache_key] = game
+                built[row] = game
+
+        return [built[row] for row in rows]
+
+    def _batch_game(
+        self,
+        record: Optional[Dict],
+        title: str,
+        platform: Optional[str],
+        source: Optional[str],
+        normalized_title: str,
+    ) -> Game:
+        """Turn a resolved (or absent) IGDB record into a rated Game."""
+        if record:
+            game = self.primary_provider.build_game_from_record(
+                record, title, platform, source
+            )
+            return game.model_copy(
+                update={
+                    **self._critic_rating_update(normalized_title),
+                    "igdb_match": True,
+                }
+            )
+        game = self._empty_game(title, platform, source, None)
+        return game.model_copy(update=self._critic_rating_update(normalized_title))
+
     def search_suggestions(self, title: str, limit: int = 5) -> list[Dict[str, str]]:
         if not self.primary_provider:
             logger.debug("No IGDB provider configured; returning empty suggestions.")
@@ -693,3 +1235,14 @@ class MetadataProvider:
         except Exception as exc:
             logger.warning("Failed to fetch suggestions: %s", exc)
             return []
+
+
+@functools.lru_cache(maxsize=None)
+def get_metadata_provider() -> MetadataProvider:
+    """Return the process-wide provider.
+
+    Constructing MetadataProvider opens an httpx connection pool and the
+    SQLite record cache; a single instance keeps HTTP keep-alive and the
+    token lifecycle shared across every caller.
+    """
+    return MetadataProvider()
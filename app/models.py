@@ -2,27 +2,33 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Game(BaseModel):
     """Metadata that the frontend knows how to render for a game."""
 
+    # Games are built at scale from our own providers; reject stray keys
+    # and skip re-validation on attribute assignment.
+    model_config = ConfigDict(extra="forbid", validate_assignment=False)
+
     title: str
     platform: Optional[str] = None
     source: Optional[str] = None
     record_id: Optional[int] = None
     description: str
-    thumbnail_url: Optional[HttpUrl] = None
-    cover_url: Optional[HttpUrl] = None
-    trailer_url: Optional[HttpUrl] = None
+    # URLs come from our own templates and IGDB; plain str skips Pydantic's
+    # per-field URL parsing, which dominates Game construction at scale.
+    thumbnail_url: Optional[str] = None
+    cover_url: Optional[str] = None
+    trailer_url: Optional[str] = None
     rating: Optional[float] = None
     rating_match_title: Optional[str] = None
     rating_source_csv: Optional[str] = None
     rating_verified: Optional[bool] = None
     rating_manual: Optional[bool] = None
     igdb_match: Optional[bool] = None
-    gallery_urls: list[HttpUrl] = Field(default_factory=list)
+    gallery_urls: list[str] = Field(default_factory=list)
     status: str = Field(default="not_allocated")
     finish_count: int = Field(default=0, ge=0)
     genres: list[str] = Field(default_factory=list)